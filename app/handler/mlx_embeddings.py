@@ -103,13 +103,10 @@ class MLXEmbeddingsHandler:
         try:
             # Check if the request is for embeddings
             if request_data.get("type") == "embeddings":
-                result = self.model(
+                return self.model(
                     texts=request_data["input"],
                     max_length=request_data.get("max_length", 512)
                 )
-                # Force garbage collection after embeddings
-                gc.collect()
-                return result
             
             raise ValueError(f"Unknown request type: {request_data.get('type')}")
             
@@ -439,7 +439,7 @@ class MLXLMHandler:
             return response
 
         except Exception as e:
-            logger.error(f"Error processing text request: {str(e)}")
+            logger.exception(f"Error processing text request: {e}")
             # Clean up on error
             gc.collect()
             raise
@@ -531,9 +531,8 @@ class MLXLMHandler:
                 # Combine all system message contents
                 combined_system_content = "\n\n".join([msg["content"] for msg in system_messages if msg.get("content")])
                 
-                # Create merged system message using the first system message as template
-                merged_system_message = system_messages[0].copy()
-                merged_system_message["content"] = combined_system_content
+                # Only role and content matter for a system turn, so build it directly
+                merged_system_message = {"role": "system", "content": combined_system_content}
                 
                 # Add merged system message at index 0
                 chat_messages.append(merged_system_message)
@@ -11,6 +11,9 @@ class BaseThinkingParser:
         self.thinking_open = thinking_open
         self.thinking_close = thinking_close
         self.is_thinking = False
+        # Pre-calculate lengths for performance
+        self._thinking_open_len = len(thinking_open)
+        self._thinking_close_len = len(thinking_close)
 
     def get_thinking_open(self):
         return self.thinking_open
@@ -23,16 +26,14 @@ class BaseThinkingParser:
         if start_thinking == -1:
             return None, content
         
-        thinking_open_len = len(self.thinking_open)
-        thinking_close_len = len(self.thinking_close)
-        start_content = start_thinking + thinking_open_len
+        start_content = start_thinking + self._thinking_open_len
         end_thinking = content.find(self.thinking_close, start_content)
         
         if end_thinking == -1:
             return None, content
         
         thinking_content = content[start_content:end_thinking].strip()
-        remaining_content = content[end_thinking + thinking_close_len:].strip()
+        remaining_content = content[end_thinking + self._thinking_close_len:].strip()
         return thinking_content, remaining_content
         
     
@@ -50,20 +51,22 @@ class BaseThinkingParser:
             
         if not self.is_thinking:
             # Check if thinking_open is in the chunk
-            if self.thinking_open in chunk:
+            start_idx = chunk.find(self.thinking_open)
+            if start_idx != -1:
                 self.is_thinking = True
-                start_idx = chunk.find(self.thinking_open)
-                after_open = chunk[start_idx + len(self.thinking_open):]
+                open_end = start_idx + self._thinking_open_len
                 before_open = chunk[:start_idx]
                 
-                # Check if thinking_close is also in this chunk (both tags in same chunk)
-                if self.thinking_close in after_open:
-                    close_idx = after_open.find(self.thinking_close)
+                # Check if thinking_close is also in this chunk (both tags in same chunk),
+                # searching only the window after the opening tag
+                close_idx = chunk.find(self.thinking_close, open_end)
+                if close_idx != -1:
                     self.is_thinking = False
                     # Return content before open tag + content after close tag
-                    after_close = after_open[close_idx + len(self.thinking_close):]
+                    after_close = chunk[close_idx + self._thinking_close_len:]
                     return (before_open + after_close) if (before_open + after_close) else None, True
                 
+                after_open = chunk[open_end:]
                 # Only opening tag found, return content before it (if any) and reasoning content after
                 # If there's content after the opening tag, return it as reasoning_content
                 if after_open:
@@ -76,10 +79,10 @@ class BaseThinkingParser:
             return chunk, False
         
         # Currently in thinking mode
-        if self.thinking_close in chunk:
-            close_idx = chunk.find(self.thinking_close)
+        close_idx = chunk.find(self.thinking_close)
+        if close_idx != -1:
             reasoning_part = chunk[:close_idx]
-            after_close = chunk[close_idx + len(self.thinking_close):]
+            after_close = chunk[close_idx + self._thinking_close_len:]
             self.is_thinking = False
             
             # If there's reasoning content before the close tag, return it with completion signal
@@ -106,6 +109,8 @@ class BaseToolParser:
         self.tool_open = tool_open
         self.tool_close = tool_close 
         self.buffer = ""
+        # Chunks seen since the opening tag; joined once the closing tag arrives
+        self._buffer_parts: List[str] = []
         self.state = ParseToolState.NORMAL
         # Pre-calculate lengths for performance
         self._tool_open_len = len(tool_open)
@@ -130,59 +135,69 @@ class BaseToolParser:
         Returns:
             A dictionary representing the parsed tool call, or None if parsing fails.
         """
-
+        # Fast path: well-formed JSON goes straight through the C-accelerated decoder;
+        # the pure-Python repair_json pass is only paid for malformed tool calls.
         try:
-            repaired_json = repair_json(tool_content)
-            return json.loads(repaired_json)
+            return json.loads(tool_content)
         except json.JSONDecodeError:
-            raise
+            pass
+
+        repaired_json = repair_json(tool_content)
+        return json.loads(repaired_json)
 
     def parse(self, content: str) -> Tuple[Optional[List[Dict[str, Any]]], str]:
         tool_calls = []
-        remaining_parts = []
+        # (start, end) offsets into content; sliced and stripped once in the final join
+        remaining_spans = []
         
         if self.tool_open not in content:
             return [], content
         
-        tool_open_len = len(self.tool_open)
-        tool_close_len = len(self.tool_close)
+        # Bind the appends once instead of resolving them on every iteration
+        add_tool_call = tool_calls.append
+        add_span = remaining_spans.append
+        tool_open_len = self._tool_open_len
+        tool_close_len = self._tool_close_len
+        content_len = len(content)
         pos = 0
         
         while True:
             start_tool = content.find(self.tool_open, pos)
             if start_tool == -1:
                 # No more tool calls, add remaining content
-                if pos < len(content):
-                    remaining_parts.append(content[pos:].strip())
+                if pos < content_len:
+                    add_span((pos, content_len))
                 break
             
             # Add content before tool call
             if start_tool > pos:
-                remaining_parts.append(content[pos:start_tool].strip())
+                add_span((pos, start_tool))
             
             # Find closing tag
             search_start = start_tool + tool_open_len
             end_tool = content.find(self.tool_close, search_start)
             if end_tool == -1:
                 # Unclosed tool tag, add remaining content and break
-                remaining_parts.append(content[pos:].strip())
+                add_span((pos, content_len))
                 break
             
             # Extract and parse tool content
             tool_content = content[search_start:end_tool].strip()
             try:
                 json_output = self._parse_tool_content(tool_content)
-                tool_calls.append(json_output)
+                add_tool_call(json_output)
             except json.JSONDecodeError:
                 print("Error parsing tool call: ", tool_content)
                 # Continue processing remaining content after error
-                remaining_parts.append(content[pos:].strip())
+                add_span((pos, content_len))
                 break
             
             # Move position past the closing tag
             pos = end_tool + tool_close_len
         
-        remaining_content = " ".join(filter(None, remaining_parts))
+        remaining_content = " ".join(
+            filter(None, (content[start:end].strip() for start, end in remaining_spans))
+        )
         return tool_calls, remaining_content
     
     def parse_stream(self, chunk: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], bool]:
@@ -195,43 +210,44 @@ class BaseToolParser:
                 - parsed_content: The parsed chunk (could be str, dict)
                 - is_complete: True if tool call is complete
         """
+        if chunk is None:
+            return None, True
+
         res = {
             "name": None,
             "arguments": None,
             "content": None,
         }
-        if chunk is None:
-            return None, True
-
         start_tool_index = chunk.find(self.tool_open)
 
         if start_tool_index != -1:
             # Reset state and buffer when entering FOUND_PREFIX
             self.state = ParseToolState.FOUND_PREFIX
-            self.buffer = ""
             self._set_content(res, chunk[:start_tool_index])
-            self.buffer += chunk[start_tool_index + self._tool_open_len:]
+            self._buffer_parts = [chunk[start_tool_index + self._tool_open_len:]]
             return res, False
 
         if self.state == ParseToolState.FOUND_PREFIX:
             end_tool_index = chunk.find(self.tool_close)
             if end_tool_index != -1:
-                tool_call_content = self.buffer + chunk[:end_tool_index]
+                self._buffer_parts.append(chunk[:end_tool_index])
+                tool_call_content = "".join(self._buffer_parts)
                 try:
                     json_output = self._parse_tool_content(tool_call_content)
                 except json.JSONDecodeError:
                     logger.error("Error parsing tool call: %s", tool_call_content)
+                    self._buffer_parts.pop()
                     return res, False
                 res["name"] = str(json_output["name"])
                 res["arguments"] = str(json_output["arguments"])
                 # Calculate remaining content once and reset state
                 remaining = chunk[end_tool_index + self._tool_close_len:]
-                self.buffer = remaining
+                self._buffer_parts = []
                 self._set_content(res, remaining)
                 self.state = ParseToolState.NORMAL
                 return res, True
             else:
-                self.buffer += chunk
+                self._buffer_parts.append(chunk)
                 return res, False
             
         self._set_content(res, chunk)
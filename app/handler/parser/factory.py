@@ -5,6 +5,7 @@ This module provides a centralized way to create parsers through explicit
 manual specification. Parsers are only created when explicitly requested.
 """
 
+from dataclasses import dataclass, fields
 from typing import Any, Callable, Dict, Optional, Tuple
 
 from loguru import logger
@@ -141,6 +142,36 @@ PARSER_METADATA: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# Flattened (parser_name, parser_type) -> class view of PARSER_REGISTRY for single lookups
+_FLAT_REGISTRY: Dict[Tuple[str, str], Callable] = {
+    (name, parser_type): parser_class
+    for name, parser_config in PARSER_REGISTRY.items()
+    for parser_type, parser_class in parser_config.items()
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _ParserMetadata:
+    """Attribute-access view of a PARSER_METADATA entry."""
+
+    respects_enable_thinking: bool = False
+    needs_redacted_reasoning_prefix: bool = False
+    has_special_parsing: bool = False
+
+
+_DEFAULT_METADATA = _ParserMetadata()
+_METADATA_FIELDS = frozenset(field.name for field in fields(_ParserMetadata))
+
+
+def _build_metadata(metadata: Dict[str, Any]) -> _ParserMetadata:
+    """Build a record from a PARSER_METADATA entry, ignoring keys it does not model."""
+    return _ParserMetadata(**{key: value for key, value in metadata.items() if key in _METADATA_FIELDS})
+
+
+_METADATA_RECORDS: Dict[str, _ParserMetadata] = {
+    name: _build_metadata(metadata) for name, metadata in PARSER_METADATA.items()
+}
+
 
 class ParserFactory:
     """Factory for creating thinking and tool parsers."""
@@ -158,21 +189,12 @@ class ParserFactory:
         Returns:
             Parser instance or None if parser type not available
         """
-        if parser_name not in PARSER_REGISTRY:
-            logger.warning(f"Unknown parser name: {parser_name}")
-            return None
-
-        parser_config = PARSER_REGISTRY[parser_name]
-
-        # Handle unified parsers (like Harmony)
-        if parser_type == "unified" and "unified" in parser_config:
-            return parser_config["unified"]()
-
-        # Handle specific parser types
-        if parser_type in parser_config:
-            parser_class = parser_config[parser_type]
+        parser_class = _FLAT_REGISTRY.get((parser_name, parser_type))
+        if parser_class is not None:
             return parser_class()
 
+        if parser_name not in PARSER_REGISTRY:
+            logger.warning(f"Unknown parser name: {parser_name}")
         return None
 
     @staticmethod
@@ -260,7 +282,7 @@ class ParserFactory:
         """
         if not parser_name:
             return False
-        return PARSER_METADATA.get(parser_name, {}).get("respects_enable_thinking", False)
+        return _METADATA_RECORDS.get(parser_name, _DEFAULT_METADATA).respects_enable_thinking
 
     @staticmethod
     def needs_redacted_reasoning_prefix(parser_name: Optional[str]) -> bool:
@@ -275,7 +297,7 @@ class ParserFactory:
         """
         if not parser_name:
             return False
-        return PARSER_METADATA.get(parser_name, {}).get("needs_redacted_reasoning_prefix", False)
+        return _METADATA_RECORDS.get(parser_name, _DEFAULT_METADATA).needs_redacted_reasoning_prefix
 
     @staticmethod
     def has_special_parsing(parser_name: Optional[str]) -> bool:
@@ -290,4 +312,4 @@ class ParserFactory:
         """
         if not parser_name:
             return False
-        return PARSER_METADATA.get(parser_name, {}).get("has_special_parsing", False)
+        return _METADATA_RECORDS.get(parser_name, _DEFAULT_METADATA).has_special_parsing
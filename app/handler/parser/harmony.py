@@ -1,21 +1,28 @@
 from openai_harmony import (
-    load_harmony_encoding,
-    HarmonyEncodingName,
     StreamableParser,
     Role
 )    
-from typing import Tuple, Dict, List, Optional, Any, Union
+from typing import Tuple, Dict, Optional, Any, Union
+from io import StringIO
 import logging
 from enum import Enum
 
+from ...utils.harmony_encoding import get_harmony_encoding
+
 logger = logging.getLogger(__name__)
 
+
 class ChannelType(Enum):
     """Enumeration of harmony channel types."""
     ANALYSIS = "analysis"
     COMMENTARY = "commentary" 
     FINAL = "final"
 
+# Plain channel names for hot-path comparisons, avoiding an Enum .value lookup per token
+_ANALYSIS = ChannelType.ANALYSIS.value
+_COMMENTARY = ChannelType.COMMENTARY.value
+_FINAL = ChannelType.FINAL.value
+
 class ParsingState(Enum):
     """Enumeration of parsing states."""
     IDLE = "idle"
@@ -32,10 +39,25 @@ class HarmonyParser:
     error handling, and support for different harmony channels (analysis, commentary, final).
     """
 
+    # A parser is created per request and read on every token
+    __slots__ = (
+        "enc",
+        "parser",
+        "end_tool_chunk",
+        "tool_state",
+        "end_stream",
+        "parsing_state",
+        "_analysis_content",
+        "_commentary_content",
+        "_final_content",
+        "_current_function_name",
+        "_function_arguments",
+    )
+
     def __init__(self):
         """Initialize the harmony parser with encoding and state management."""
         try:
-            self.enc = load_harmony_encoding(HarmonyEncodingName.HARMONY_GPT_OSS)
+            self.enc = get_harmony_encoding()
             self.parser = StreamableParser(self.enc, role=Role.ASSISTANT)
         except Exception as e:
             logger.error(f"Failed to initialize harmony encoding: {e}")
@@ -52,11 +74,10 @@ class HarmonyParser:
         self.tool_state = False
         self.end_stream = False
         self.parsing_state = ParsingState.IDLE
-        self._accumulated_content = {
-            ChannelType.ANALYSIS.value: [],
-            ChannelType.COMMENTARY.value: [],
-            ChannelType.FINAL.value: []
-        }
+        # One growing text buffer per channel for the whole stream
+        self._analysis_content = StringIO()
+        self._commentary_content = StringIO()
+        self._final_content = StringIO()
         self._current_function_name = None
         self._function_arguments = []
     
@@ -90,17 +111,20 @@ class HarmonyParser:
             self.parsing_state = ParsingState.PROCESSING_TOKENS
             text_tokens = self.enc.encode(text, allowed_special="all")
             
-            # Initialize local variables for this chunk
-            contents: List[str] = []
-            function_name: Optional[str] = None
-            function_arguments: List[str] = []
-            reasoning_content: List[str] = []
+            # Content extracted from this chunk, filled in by the channel handlers
+            chunk_data: Dict[str, Any] = {
+                'reasoning_content': [],
+                'function_name': None,
+                'function_arguments': [],
+                'contents': []
+            }
             current_channel: Optional[str] = None
+            process = self.parser.process
             
             # Process each token
             for text_token in text_tokens:
                 try:
-                    stream_text = self.parser.process(text_token)
+                    stream_text = process(text_token)
                     current_channel = stream_text.current_channel
                     content = stream_text.last_content_delta
                     
@@ -108,46 +132,52 @@ class HarmonyParser:
                         continue
                         
                     # Handle different channels
-                    if current_channel == ChannelType.ANALYSIS.value:
-                        reasoning_content.append(content)
-                        self._accumulated_content[ChannelType.ANALYSIS.value].append(content)
-                        
-                    elif current_channel == ChannelType.COMMENTARY.value:
-                        self.parsing_state = ParsingState.TOOL_PARSING
-                        
-                        if self.tool_state:
-                            # Already parsing function arguments
-                            function_arguments.append(content)
-                            self._function_arguments.append(content)
-                        else:
-                            # Start of new function call
-                            self.tool_state = True
-                            if hasattr(stream_text, 'current_recipient') and stream_text.current_recipient:
-                                function_name = stream_text.current_recipient.replace("functions.", "")
-                                self._current_function_name = function_name
-                            function_arguments = [content]
-                            self._function_arguments = [content]
-                            
-                    elif current_channel == ChannelType.FINAL.value:
-                        contents.append(content)
-                        self._accumulated_content[ChannelType.FINAL.value].append(content)
+                    if current_channel == _ANALYSIS:
+                        self._on_analysis(content, stream_text, chunk_data)
+                    elif current_channel == _COMMENTARY:
+                        self._on_commentary(content, stream_text, chunk_data)
+                    elif current_channel == _FINAL:
+                        self._on_final(content, stream_text, chunk_data)
                         
                 except Exception as token_error:
                     logger.warning(f"Error processing token {text_token}: {token_error}")
-                    continue
             
             # Return appropriate response based on current channel
-            return self._build_response(current_channel, {
-                'reasoning_content': reasoning_content,
-                'function_name': function_name,
-                'function_arguments': function_arguments,
-                'contents': contents
-            })
+            return self._build_response(current_channel, chunk_data)
             
         except Exception as e:
             logger.error(f"Error in parse_stream: {e}")
             return None, self.end_stream
     
+    def _on_analysis(self, content: str, stream_text: Any, chunk_data: Dict[str, Any]) -> None:
+        """Record a reasoning delta from the analysis channel."""
+        chunk_data['reasoning_content'].append(content)
+        self._analysis_content.write(content)
+
+    def _on_commentary(self, content: str, stream_text: Any, chunk_data: Dict[str, Any]) -> None:
+        """Record a tool-call delta from the commentary channel."""
+        self.parsing_state = ParsingState.TOOL_PARSING
+        
+        if self.tool_state:
+            # Already parsing function arguments
+            chunk_data['function_arguments'].append(content)
+            self._function_arguments.append(content)
+        else:
+            # Start of new function call
+            self.tool_state = True
+            recipient = getattr(stream_text, 'current_recipient', None)
+            if recipient:
+                function_name = recipient.replace("functions.", "")
+                chunk_data['function_name'] = function_name
+                self._current_function_name = function_name
+            chunk_data['function_arguments'] = [content]
+            self._function_arguments = [content]
+
+    def _on_final(self, content: str, stream_text: Any, chunk_data: Dict[str, Any]) -> None:
+        """Record a final-answer delta."""
+        chunk_data['contents'].append(content)
+        self._final_content.write(content)
+    
     def _build_response(self, current_channel: Optional[str], content_data: Dict[str, Any]) -> Tuple[Optional[Union[Dict[str, Any], str]], bool]:
         """
         Build the appropriate response based on the current channel.
@@ -165,27 +195,27 @@ class HarmonyParser:
             return None, self.end_stream
             
         try:
-            if current_channel == ChannelType.ANALYSIS.value:
+            if current_channel == _ANALYSIS:
                 reasoning_content = content_data.get('reasoning_content', [])
                 if reasoning_content:
                     return {
                         "reasoning_content": "".join(reasoning_content)
                     }, self.end_stream
                     
-            elif current_channel == ChannelType.COMMENTARY.value:
+            elif current_channel == _COMMENTARY:
                 function_name = content_data.get('function_name')
                 function_arguments = content_data.get('function_arguments', [])
                 
-                response = {}
-                if function_name:
-                    response["name"] = function_name
+                # Return dict literals rather than filling an empty dict key by key
                 if function_arguments:
-                    response["arguments"] = "".join(function_arguments)
-                
-                if response:
-                    return response, self.end_stream
+                    arguments = "".join(function_arguments)
+                    if function_name:
+                        return {"name": function_name, "arguments": arguments}, self.end_stream
+                    return {"arguments": arguments}, self.end_stream
+                if function_name:
+                    return {"name": function_name}, self.end_stream
                     
-            elif current_channel == ChannelType.FINAL.value:
+            elif current_channel == _FINAL:
                 contents = content_data.get('contents', [])
                 if contents:
                     return "".join(contents), self.end_stream
@@ -209,13 +239,15 @@ class HarmonyParser:
         Returns:
             Dictionary of channel content
         """
-        if channel and channel in self._accumulated_content:
-            return {channel: "".join(self._accumulated_content[channel])}
-        
-        return {
-            ch: "".join(content) for ch, content in self._accumulated_content.items() 
-            if content
+        accumulated = {
+            _ANALYSIS: self._analysis_content.getvalue(),
+            _COMMENTARY: self._commentary_content.getvalue(),
+            _FINAL: self._final_content.getvalue()
         }
+        if channel and channel in accumulated:
+            return {channel: accumulated[channel]}
+        
+        return {ch: content for ch, content in accumulated.items() if content}
 
     def parse(self, text: str) -> Dict[str, Any]:
         """
@@ -249,9 +281,8 @@ class HarmonyParser:
             
         try:
             # Remove end tool chunk if present
-            clean_text = text
-            if self.end_tool_chunk in text:
-                clean_text = text.split(self.end_tool_chunk)[0]
+            clean_text, end_tool_chunk, _ = text.partition(self.end_tool_chunk)
+            if end_tool_chunk:
                 logger.debug(f"Removed end tool chunk, processing {len(clean_text)} characters")
             
             # Encode and parse messages
@@ -261,29 +292,32 @@ class HarmonyParser:
             # Process each parsed message
             for message in parsed_messages:
                 try:
-                    if not hasattr(message, 'channel') or not hasattr(message, 'content'):
+                    try:
+                        channel = message.channel
+                        content = message.content
+                    except AttributeError:
                         logger.warning(f"Invalid message structure: {message}")
                         continue
                         
-                    if message.channel == ChannelType.ANALYSIS.value:
-                        if message.content and len(message.content) > 0:
-                            result["reasoning_content"] = message.content[0].text
+                    if channel == _ANALYSIS:
+                        if content:
+                            result["reasoning_content"] = content[0].text
                             logger.debug("Extracted reasoning content")
                             
-                    elif message.channel == ChannelType.COMMENTARY.value:
-                        if (hasattr(message, 'recipient') and message.recipient and 
-                            message.content and len(message.content) > 0):
+                    elif channel == _COMMENTARY:
+                        recipient = getattr(message, 'recipient', None)
+                        if recipient and content:
                             
                             tool_call = {
-                                "name": message.recipient.replace("functions.", ""),
-                                "arguments": message.content[0].text
+                                "name": recipient.replace("functions.", ""),
+                                "arguments": content[0].text
                             }
                             result["tool_calls"] = [tool_call]
                             logger.debug(f"Extracted tool call: {tool_call['name']}")
                             
-                    elif message.channel == ChannelType.FINAL.value:
-                        if message.content and len(message.content) > 0:
-                            result["content"] = message.content[0].text
+                    elif channel == _FINAL:
+                        if content:
+                            result["content"] = content[0].text
                             logger.debug("Extracted final content")
                             
                 except Exception as msg_error:
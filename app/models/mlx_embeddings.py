@@ -59,12 +59,10 @@ class MLX_Embeddings:
             return mx.array(outputs)
             
         except Exception as e:
-            # Clean up on error
+            # Clean up on error; on success the intermediates are freed by refcounting
+            # and MLX keeps its buffer cache warm for the next batch
             self._cleanup_arrays(inputs, outputs)
             raise
-        finally:
-            # Always clean up intermediate arrays
-            self._cleanup_arrays(inputs, outputs)
 
     def _cleanup_arrays(self, *arrays):
         """Clean up MLX arrays to free memory."""
@@ -98,12 +96,7 @@ class MLX_Embeddings:
         try:
             embeddings = self._get_embeddings(texts, max_length)
             # Convert to Python list and return
-            result = embeddings.tolist()
-            # Clean up the embeddings array
-            del embeddings
-            mx.clear_cache()
-            gc.collect()
-            return result
+            return embeddings.tolist()
         except Exception as e:
             # Clean up on error
             mx.clear_cache()
@@ -5,20 +5,39 @@ from mlx_lm.generate import (
     stream_generate
 )
 from dataclasses import dataclass
+from functools import lru_cache
 from mlx_lm.generate import GenerationResponse
-from outlines.processors import JSONLogitsProcessor
 from mlx_lm.models.cache import make_prompt_cache
 from mlx_lm.sample_utils import make_sampler, make_logits_processors
-from ..utils.outlines_transformer_tokenizer import OutlinesTransformerTokenizer
-from typing import List, Dict, Union, Generator, Any
+from typing import Any, Callable, Dict, Generator, List, Union
+
+DEFAULT_TEMPERATURE = float(os.getenv("DEFAULT_TEMPERATURE", 0.7))
+DEFAULT_TOP_P = float(os.getenv("DEFAULT_TOP_P", 0.95))
+DEFAULT_TOP_K = int(os.getenv("DEFAULT_TOP_K", 20))
+DEFAULT_MIN_P = float(os.getenv("DEFAULT_MIN_P", 0.0))
+DEFAULT_SEED = int(os.getenv("DEFAULT_SEED", 0))
+DEFAULT_MAX_TOKENS = int(os.getenv("DEFAULT_MAX_TOKENS", 8192))
+DEFAULT_BATCH_SIZE = int(os.getenv("DEFAULT_BATCH_SIZE", 32))
+
+
+@lru_cache(maxsize=32)
+def _get_sampler(
+    temp: float, top_p: float, top_k: int, min_p: float
+) -> Callable[[mx.array], mx.array]:
+    """Return a sampler for these settings, reused while a deployment's settings stay fixed."""
+    return make_sampler(temp=temp, top_p=top_p, top_k=top_k, min_p=min_p)
+
+
+@lru_cache(maxsize=32)
+def _get_logits_processors(repetition_penalty: float, repetition_context_size: int) -> tuple:
+    """Return the stateless logits processors for these settings as a shared tuple."""
+    return tuple(
+        make_logits_processors(
+            repetition_penalty=repetition_penalty,
+            repetition_context_size=repetition_context_size,
+        )
+    )
 
-DEFAULT_TEMPERATURE = os.getenv("DEFAULT_TEMPERATURE", 0.7)
-DEFAULT_TOP_P = os.getenv("DEFAULT_TOP_P", 0.95)
-DEFAULT_TOP_K = os.getenv("DEFAULT_TOP_K", 20)
-DEFAULT_MIN_P = os.getenv("DEFAULT_MIN_P", 0.0)
-DEFAULT_SEED = os.getenv("DEFAULT_SEED", 0)
-DEFAULT_MAX_TOKENS = os.getenv("DEFAULT_MAX_TOKENS", 8192)
-DEFAULT_BATCH_SIZE = os.getenv("DEFAULT_BATCH_SIZE", 32)
 
 @dataclass
 class CompletionResponse:
@@ -58,7 +77,8 @@ class MLX_LM:
             self.bos_token = self.tokenizer.bos_token
             self.model_type = self.model.model_type
             self.context_length = context_length
-            self.outlines_tokenizer = OutlinesTransformerTokenizer(self.tokenizer)
+            # Built on the first structured-output request; see outlines_tokenizer
+            self._outlines_tokenizer = None
             if chat_template_file:
                 if not os.path.exists(chat_template_file):
                     raise ValueError(f"Chat template file {chat_template_file} does not exist")
@@ -67,6 +87,15 @@ class MLX_LM:
         except Exception as e:
             raise ValueError(f"Error loading model: {str(e)}")
 
+    @property
+    def outlines_tokenizer(self) -> Any:
+        """Outlines tokenizer wrapper, imported and built on first use."""
+        if self._outlines_tokenizer is None:
+            # outlines is heavy to import and only needed for JSON schema requests
+            from ..utils.outlines_transformer_tokenizer import OutlinesTransformerTokenizer
+            self._outlines_tokenizer = OutlinesTransformerTokenizer(self.tokenizer)
+        return self._outlines_tokenizer
+
     def create_prompt_cache(self) -> List[Any]:
         return make_prompt_cache(self.model, max_kv_size=self.context_length)
         
@@ -110,18 +139,20 @@ class MLX_LM:
         seed = kwargs.get("seed", DEFAULT_SEED)
         max_tokens = kwargs.get("max_tokens", DEFAULT_MAX_TOKENS)
 
-        sampler_kwargs = {
-            "temp": kwargs.get("temperature", DEFAULT_TEMPERATURE),
-            "top_p": kwargs.get("top_p", DEFAULT_TOP_P),
-            "top_k": kwargs.get("top_k", DEFAULT_TOP_K),
-            "min_p": kwargs.get("min_p", DEFAULT_MIN_P)
-        }
+        sampler = _get_sampler(
+            kwargs.get("temperature", DEFAULT_TEMPERATURE),
+            kwargs.get("top_p", DEFAULT_TOP_P),
+            kwargs.get("top_k", DEFAULT_TOP_K),
+            kwargs.get("min_p", DEFAULT_MIN_P),
+        )
 
         repetition_penalty = kwargs.get("repetition_penalty", 1.0)
         repetition_context_size = kwargs.get("repetition_context_size", 20)
-        logits_processors = make_logits_processors(repetition_penalty=repetition_penalty, repetition_context_size=repetition_context_size)
+        # Copy the shared processors so a per-request JSON processor is not cached with them
+        logits_processors = list(_get_logits_processors(repetition_penalty, repetition_context_size))
         json_schema = kwargs.get("schema", None)
         if json_schema:
+            from outlines.processors import JSONLogitsProcessor
             logits_processors.append(
                 JSONLogitsProcessor(
                     schema = json_schema,
@@ -133,10 +164,6 @@ class MLX_LM:
         mx.random.seed(seed)
         
         prompt_progress_callback = kwargs.get("prompt_progress_callback")
-        
-        sampler = make_sampler(
-           **sampler_kwargs
-        )
 
         stream_response = stream_generate(
             self.model,
@@ -151,17 +178,18 @@ class MLX_LM:
         if stream:
             return stream_response
 
-        text = ""
+        # Collect the segments and join once instead of growing a string per token
+        text_parts = []
         tokens = []
         final_chunk = None
         for chunk in stream_response:
-            text += chunk.text
+            text_parts.append(chunk.text)
             tokens.append(chunk.token)
             if chunk.finish_reason:
                 final_chunk = chunk
         
         return CompletionResponse(
-            text=text,
+            text="".join(text_parts),
             tokens=tokens,
             peak_memory=final_chunk.peak_memory,
             generation_tps=final_chunk.generation_tps,
@@ -9,10 +9,10 @@ from mlx_vlm.video_generate import process_vision_info
 from ..utils.prompt_cache import LRUPromptCache
 
 # Default model parameters
-DEFAULT_MAX_TOKENS = os.getenv("DEFAULT_MAX_TOKENS", 8192)
-DEFAULT_TEMPERATURE = os.getenv("DEFAULT_TEMPERATURE", 0.0)
-DEFAULT_TOP_P = os.getenv("DEFAULT_TOP_P", 1.0)
-DEFAULT_SEED = os.getenv("DEFAULT_SEED", 0)
+DEFAULT_MAX_TOKENS = int(os.getenv("DEFAULT_MAX_TOKENS", 8192))
+DEFAULT_TEMPERATURE = float(os.getenv("DEFAULT_TEMPERATURE", 0.0))
+DEFAULT_TOP_P = float(os.getenv("DEFAULT_TOP_P", 1.0))
+DEFAULT_SEED = int(os.getenv("DEFAULT_SEED", 0))
 
 @dataclass
 class CompletionResponse:
@@ -128,18 +128,19 @@ class MLX_VLM:
         if stream:
             return response_generator
 
-        text = ""
+        # Collect the segments and join once instead of growing a string per token
+        text_parts = []
         tokens = []
         final_chunk = None
 
         for chunk in response_generator:
             if chunk and chunk.text:
-                text += chunk.text
+                text_parts.append(chunk.text)
                 tokens.append(chunk.token)
                 final_chunk = chunk
 
         return CompletionResponse(
-            text=text,
+            text="".join(text_parts),
             tokens=tokens,
             peak_memory=final_chunk.peak_memory,
             generation_tps=final_chunk.generation_tps,
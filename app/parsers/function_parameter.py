@@ -8,6 +8,10 @@ from .abstract_parser import AbstractToolParser
 TOOL_OPEN = "<tool_call>"
 TOOL_CLOSE = "</tool_call>"
 
+# Shared by every parser instance; the grammar does not depend on the tool schema
+FUNCTION_REGEX = re.compile(r"<function=([^>]+)>\s*(.*?)\s*</function>", re.DOTALL)
+PARAMETER_REGEX = re.compile(r"<parameter=([^>]+)>\s*(.*?)\s*</parameter>", re.DOTALL)
+
 
 class FunctionParameterToolParser(AbstractToolParser):
     """Base tool parser for models using <function=...><parameter=...> format.
@@ -38,15 +42,9 @@ class FunctionParameterToolParser(AbstractToolParser):
         """
         super().__init__(tool_open=tool_open, tool_close=tool_close)
         # Regex pattern to extract function name and content
-        self.tool_regex = re.compile(
-            r"<function=([^>]+)>\s*(.*?)\s*</function>",
-            re.DOTALL,
-        )
+        self.tool_regex = FUNCTION_REGEX
         # Regex pattern to extract parameter key-value pairs
-        self.parameter_regex = re.compile(
-            r"<parameter=([^>]+)>\s*(.*?)\s*</parameter>",
-            re.DOTALL,
-        )
+        self.parameter_regex = PARAMETER_REGEX
 
     def extract_tool_calls(self, model_output: str) -> dict[str, list] | None:
         """Extract tool calls from complete model output.
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from enum import Enum
 from openai_harmony import (
-    load_harmony_encoding,
-    HarmonyEncodingName,
     StreamableParser,
     Role
 )    
 
+from ..utils.harmony_encoding import get_harmony_encoding
+
+
 class ChannelType(Enum):
     """Enumeration of harmony channel types."""
 
@@ -25,7 +26,7 @@ class HarmonyParser:
     """Parser for Harmony encoding."""
 
     def __init__(self):
-        self.encoding = load_harmony_encoding(HarmonyEncodingName.HARMONY_GPT_OSS)
+        self.encoding = get_harmony_encoding()
         self.parser = StreamableParser(self.encoding, role=Role.ASSISTANT)
 
         self.end_tool_chunk = "<|call|>"
@@ -37,8 +38,8 @@ class HarmonyParser:
         """
         Parse the text and return the parsed content.
         """
-        if self.end_tool_chunk in text:
-            text = text.split(self.end_tool_chunk)[0]
+        # Keep only the text before the first end marker (the whole text if absent)
+        text = text.partition(self.end_tool_chunk)[0]
 
         result = {
             "content": None,
@@ -81,15 +82,17 @@ class HarmonyParser:
         contents = []
         end_stream_state = False
 
-        # Check for end marker and truncate
-        if self.end_tool_chunk in chunk:
-            chunk = chunk[:chunk.find(self.end_tool_chunk)]
+        # Check for end marker and truncate, scanning the chunk only once
+        end_tool_idx = chunk.find(self.end_tool_chunk)
+        if end_tool_idx != -1:
+            chunk = chunk[:end_tool_idx]
             end_stream_state = True
         
         # Process chunk tokens
         chunk_tokens = self.encoding.encode(chunk, allowed_special="all")
+        process = self.parser.process
         for chunk_token in chunk_tokens:
-            stream_text = self.parser.process(chunk_token)
+            stream_text = process(chunk_token)
             content = stream_text.last_content_delta
 
             if not content:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import json
+from functools import lru_cache
 
 from .abstract_parser import (
     AbstractReasoningParser,
@@ -15,6 +16,12 @@ REASONING_OPEN = "<think>"
 REASONING_CLOSE = "</think>"
 
 
+@lru_cache(maxsize=32)
+def _compile_tag_regex(open_tag: str, close_tag: str) -> re.Pattern[str]:
+    """Compile (once per tag pair) the pattern capturing text between two tags."""
+    return re.compile(f"{re.escape(open_tag)}(.*?){re.escape(close_tag)}", re.DOTALL)
+
+
 class HermesReasoningParser(AbstractReasoningParser):
     """Reasoning parser for Hermes model's reasoning response format.
 
@@ -25,7 +32,7 @@ class HermesReasoningParser(AbstractReasoningParser):
     def __init__(self, reasoning_open: str = REASONING_OPEN, reasoning_close: str = REASONING_CLOSE) -> None:
         """Initialize the Hermes reasoning parser with appropriate regex patterns."""
         super().__init__(reasoning_open=reasoning_open, reasoning_close=reasoning_close)
-        self.reasoning_regex = re.compile(f"{re.escape(reasoning_open)}(.*?){re.escape(reasoning_close)}", re.DOTALL)
+        self.reasoning_regex = _compile_tag_regex(reasoning_open, reasoning_close)
 
     def extract_reasoning(self, model_output: str) -> dict[str, str] | None:
         """Extract reasoning content from complete model output.
@@ -41,16 +48,17 @@ class HermesReasoningParser(AbstractReasoningParser):
             Dictionary with 'reasoning' key containing extracted content,
             or None if no reasoning found.
         """
-        matches = self.reasoning_regex.findall(model_output)
+        # Only the first reasoning block is returned, so stop scanning once it is found
+        match = self.reasoning_regex.search(model_output)
         after_reasoning_close_content = None
-        if not matches:
+        if match is None:
             return {
                 "content": model_output
             }
         reasoning_content_end_idx = model_output.rfind(self.reasoning_close)
         after_reasoning_close_content = model_output[reasoning_content_end_idx + len(self.reasoning_close):]
         return {
-            "reasoning_content": matches[0],
+            "reasoning_content": match.group(1),
             "after_reasoning_close_content": after_reasoning_close_content
         }
 
@@ -72,17 +80,26 @@ class HermesReasoningParser(AbstractReasoningParser):
             - is_complete: False if not complete or in normal state, True if complete
         """
 
-        if self.reasoning_open in chunk:
+        reasoning_content_start_idx = chunk.find(self.reasoning_open)
+        if reasoning_content_start_idx != -1:
             self.state = ReasoningParserState.FOUND_PREFIX
-            reasoning_content_start_idx = chunk.find(self.reasoning_open)
-            reasoning_content = chunk[reasoning_content_start_idx + len(self.reasoning_open):]
+            reasoning_content_start_idx += len(self.reasoning_open)
+            # A block that also closes in this chunk is emitted together with the
+            # content after it, instead of leaking the closing tag into reasoning
+            reasoning_content_end_idx = chunk.find(self.reasoning_close, reasoning_content_start_idx)
+            if reasoning_content_end_idx != -1:
+                return {
+                    "reasoning_content": chunk[reasoning_content_start_idx:reasoning_content_end_idx],
+                    "after_reasoning_close_content": chunk[reasoning_content_end_idx + len(self.reasoning_close):]
+                }, True
+            reasoning_content = chunk[reasoning_content_start_idx:]
             return {
                 "reasoning_content": reasoning_content
             }, False
 
         if self.state == ReasoningParserState.FOUND_PREFIX:
-            if self.reasoning_close in chunk:
-                reasoning_content_end_idx = chunk.find(self.reasoning_close)
+            reasoning_content_end_idx = chunk.find(self.reasoning_close)
+            if reasoning_content_end_idx != -1:
                 reasoning_content = chunk[:reasoning_content_end_idx]
                 after_reasoning_close_content = chunk[reasoning_content_end_idx + len(self.reasoning_close):]
                 return {
@@ -109,9 +126,8 @@ class HermesToolParser(AbstractToolParser):
     """
 
     def __init__(self, tool_open: str = TOOL_OPEN, tool_close: str = TOOL_CLOSE) -> None:
-        """Initialize the Hermes4 tool parser with appropriate regex patterns."""
+        """Initialize the Hermes4 tool parser with the tool call tags."""
         super().__init__(tool_open=tool_open, tool_close=tool_close)
-        self.tool_regex = re.compile(f"{re.escape(tool_open)}(.*?){re.escape(tool_close)}", re.DOTALL)
 
     def extract_tool_calls(self, model_output: str) -> dict[str, list] | None:
         """Extract tool calls from complete model output.
@@ -127,7 +143,17 @@ class HermesToolParser(AbstractToolParser):
             Dictionary with 'tool_calls' key containing list of parsed tool calls,
             or None if no tool calls found. Each tool call has 'name' and 'arguments'.
         """
-        matches = self.tool_regex.findall(model_output)
+        # Plain find scan over the literal tags, collecting each non-greedy tag body
+        matches = []
+        tool_open_len = len(self.tool_open)
+        pos = model_output.find(self.tool_open)
+        while pos != -1:
+            body_start = pos + tool_open_len
+            body_end = model_output.find(self.tool_close, body_start)
+            if body_end == -1:
+                break
+            matches.append(model_output[body_start:body_end])
+            pos = model_output.find(self.tool_open, body_end + len(self.tool_close))
         if not matches:
             return {
                 "content": model_output
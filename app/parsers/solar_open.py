@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import re
 from enum import Enum
+from functools import lru_cache
 
 from loguru import logger
 
@@ -19,6 +21,42 @@ TOOL_CLOSE = "<|tool_call:end|>"
 TOOL_NAME_PREFIX = "<|tool_call:name|>"
 TOOL_ARGS_PREFIX = "<|tool_call:args|>"
 
+# Tool-call structure tags, matched in a single forward pass by extract_tool_calls.
+# Each tag has its own capture group, so match.lastindex identifies the tag
+# (1=begin, 2=name, 3=args, 4=end) without comparing strings.
+TOOL_CALL_TAG_REGEX = re.compile(
+    "|".join(
+        f"({re.escape(tag)})"
+        for tag in (TOOL_OPEN, TOOL_NAME_PREFIX, TOOL_ARGS_PREFIX, TOOL_CLOSE)
+    )
+)
+
+# Every tag the streaming tool parser reacts to, matched in a single pass;
+# match.lastindex is 1 for the content token, 2 for begin and 3 for end
+STREAM_TAG_REGEX = re.compile(
+    "|".join(f"({re.escape(tag)})" for tag in (CONTENT_RESPONSE_TOKEN, TOOL_OPEN, TOOL_CLOSE))
+)
+_STREAM_CONTENT, _STREAM_TOOL_OPEN, _STREAM_TOOL_CLOSE = 1, 2, 3
+
+# Every Solar Open tag starts with this prefix; text without it cannot hold a tag
+_TAG_PREFIX = "<|"
+
+# Characters a JSON document can start with, including leading JSON whitespace
+_JSON_START_CHARS = frozenset('{["-0123456789tfn \t\n\r')
+
+
+@lru_cache(maxsize=256)
+def _json_error(text: str) -> str | None:
+    """Return the JSON decode error for text, or None if it is valid JSON."""
+    if not text or text[0] not in _JSON_START_CHARS:
+        # Same message json.loads raises, without the exception round trip
+        return "Expecting value: line 1 column 1 (char 0)"
+    try:
+        json.loads(text)
+    except json.JSONDecodeError as e:
+        return str(e)
+    return None
+
 
 class SolarOpenToolState(Enum):
     """State constants for Solar Open tool parser streaming operations."""
@@ -53,6 +91,11 @@ class SolarOpenToolParser(AbstractToolParser):
         self.content_response_token = CONTENT_RESPONSE_TOKEN
         self.tool_name_prefix = TOOL_NAME_PREFIX
         self.tool_args_prefix = TOOL_ARGS_PREFIX
+        # Characters of already-buffered text to rescan so a tag split across chunks is found
+        self._tag_overlap = max(len(CONTENT_RESPONSE_TOKEN), len(TOOL_OPEN), len(TOOL_CLOSE)) - 1
+        # Streamed chunks awaiting tool-call extraction, and the end of the streamed text
+        self._buffer_parts: list[str] = []
+        self._buffer_tail = ""
 
     def extract_tool_calls(self, model_output: str) -> dict[str, list] | None:
         """Extract tool calls from complete model output.
@@ -68,60 +111,67 @@ class SolarOpenToolParser(AbstractToolParser):
             Dictionary with 'content' or 'tool_calls' key, or None if parsing fails.
         """
         # Check for content response first
-        content_idx = model_output.find(self.content_response_token)
-        if content_idx != -1:
-            content = model_output[content_idx + len(self.content_response_token) :]
+        _, content_token, content = model_output.partition(self.content_response_token)
+        if content_token:
             return {"content": content}
 
-        # Parse tool calls
-        tool_calls = []
-        remaining_output = model_output
+        return self._parse_tool_calls(model_output)
 
-        while self.tool_open in remaining_output:
-            tool_call_open_idx = remaining_output.find(self.tool_open)
-            tool_call_name_idx = remaining_output.find(
-                self.tool_name_prefix, tool_call_open_idx
-            )
-            tool_call_args_idx = remaining_output.find(
-                self.tool_args_prefix, tool_call_name_idx
-            )
-            tool_call_close_idx = remaining_output.find(
-                self.tool_close, tool_call_args_idx
-            )
+    def _parse_tool_calls(self, model_output: str) -> dict[str, list]:
+        """Parse tool calls from output already known to carry no content token.
 
-            # Validate all required tokens were found
-            if (
-                tool_call_name_idx == -1
-                or tool_call_args_idx == -1
-                or tool_call_close_idx == -1
-            ):
-                logger.warning(
-                    f"Malformed tool call in output, missing required tokens: {remaining_output[:100]}"
-                )
-                break
+        Parameters
+        ----------
+        model_output : str
+            Model output containing tool calls.
 
-            # Extract tool name and arguments
-            tool_name = remaining_output[
-                tool_call_name_idx + len(self.tool_name_prefix) : tool_call_args_idx
-            ].strip()
-            tool_args = remaining_output[
-                tool_call_args_idx + len(self.tool_args_prefix) : tool_call_close_idx
-            ].strip()
-
-            # Validate JSON arguments
-            try:
-                json.loads(tool_args)  # Validate JSON format
-                tool_calls.append({"name": tool_name, "arguments": tool_args})
-            except json.JSONDecodeError as e:
-                logger.warning(
-                    f"Invalid JSON in tool arguments for '{tool_name}': {e}"
-                )
-                # Skip this malformed tool call and continue
-
-            # Move past this tool call
-            remaining_output = remaining_output[
-                tool_call_close_idx + len(self.tool_close) :
-            ]
+        Returns
+        -------
+        dict[str, list]
+            Dictionary with 'tool_calls' and the trailing 'content' (or None).
+        """
+        # Parse tool calls in a single forward pass over the tags. Each stage waits
+        # for its tag (begin, name, args, end) and skips any other tag meanwhile.
+        tool_calls = []
+        stage = 0
+        name_start = args_start = 0
+        # Offset just past the last complete tool call; what follows is content
+        content_start = 0
+
+        for match in TOOL_CALL_TAG_REGEX.finditer(model_output):
+            # Group numbers follow the tag order, so stage N waits for group N + 1
+            if match.lastindex != stage + 1:
+                continue
+            if stage == 1:
+                name_start = match.end()
+            elif stage == 2:
+                tool_name = model_output[name_start : match.start()].strip()
+                args_start = match.end()
+            elif stage == 3:
+                tool_args = model_output[args_start : match.start()].strip()
+
+                # Validate JSON arguments
+                error = _json_error(tool_args)
+                if error is None:
+                    tool_calls.append({"name": tool_name, "arguments": tool_args})
+                else:
+                    logger.warning(
+                        f"Invalid JSON in tool arguments for '{tool_name}': {error}"
+                    )
+                    # Skip this malformed tool call and continue
+
+                # Move past this tool call
+                content_start = match.end()
+                stage = 0
+                continue
+            stage += 1
+
+        remaining_output = model_output[content_start:]
+        # Validate all required tokens were found for the last tool call
+        if stage:
+            logger.warning(
+                f"Malformed tool call in output, missing required tokens: {remaining_output[:100]}"
+            )
 
         return {
             "tool_calls": tool_calls,
@@ -145,35 +195,60 @@ class SolarOpenToolParser(AbstractToolParser):
             - extracted_content: Parsed content or None if buffering
             - is_complete: True if chunk should be sent, False if buffering
         """
-        # Add chunk to buffer for processing
-        self.buffer += chunk
+        # Tags in earlier chunks were already acted on, so only the new chunk plus a
+        # short tail of the buffered text needs scanning
+        window = self._buffer_tail + chunk
+        self._buffer_tail = window[-self._tag_overlap :]
+
+        # One pass over the scan window records which tags appear; the group number
+        # of each match says which tag it is
+        content_end = -1
+        tool_opened = tool_closed = False
+        # Plain text chunks skip the regex scan entirely
+        matches = STREAM_TAG_REGEX.finditer(window) if _TAG_PREFIX in window else ()
+        for match in matches:
+            tag = match.lastindex
+            if tag == _STREAM_CONTENT:
+                content_end = match.end()
+                break
+            if tag == _STREAM_TOOL_OPEN:
+                tool_opened = True
+            else:
+                tool_closed = True
 
         # Check for content response token
-        if self.content_response_token in self.buffer:
+        if content_end != -1:
             self.state = SolarOpenToolState.FOUND_CONTENT
-            content_idx = self.buffer.find(self.content_response_token)
-            content = self.buffer[content_idx + len(self.content_response_token) :]
-            self.buffer = ""  # Clear buffer
+            content = window[content_end:]
+            # Clear buffer
+            self._buffer_parts = []
+            self._buffer_tail = ""
             return {"content": content}, True
 
         # If already in content mode, stream content directly
-        if self.state == SolarOpenToolState.FOUND_CONTENT:
+        if self.state is SolarOpenToolState.FOUND_CONTENT:
             return {"content": chunk}, True
 
-        # Check for tool call
-        if self.tool_open in self.buffer:
+        # Keep the chunk for tool-call extraction; joined only once a call completes
+        self._buffer_parts.append(chunk)
+
+        if self.state is SolarOpenToolState.NORMAL:
+            if not tool_opened:
+                # Normal state - keep buffering
+                return None, False
+            # Found a tool call
             self.state = SolarOpenToolState.FOUND_TOOL_CALL
+            # A closing tag may already sit in the buffer ahead of the opening one
+            tool_closed = tool_closed or self.tool_close in "".join(self._buffer_parts)
 
-        # If in tool call state, buffer until we have complete tool call(s)
-        if self.state == SolarOpenToolState.FOUND_TOOL_CALL:
-            if self.tool_close in self.buffer:
-                # We have at least one complete tool call
-                result = self.extract_tool_calls(self.buffer)
-                self.buffer = ""
-                self.state = SolarOpenToolState.NORMAL
-                return result, True
-            # Still buffering
+        # In tool call state, buffer until we have complete tool call(s)
+        if not tool_closed:
             return None, False
 
-        # Normal state - keep buffering
-        return None, False
\ No newline at end of file
+        # We have at least one complete tool call
+        # A content token would have switched to content mode, so skip that check
+        result = self._parse_tool_calls("".join(self._buffer_parts))
+        self._buffer_parts = []
+        self._buffer_tail = ""
+        self.state = SolarOpenToolState.NORMAL
+        return result, True
@@ -0,0 +1,18 @@
+"""Shared loader for the GPT-OSS harmony encoding."""
+
+from functools import lru_cache
+
+from openai_harmony import HarmonyEncoding, HarmonyEncodingName, load_harmony_encoding
+
+
+@lru_cache(maxsize=1)
+def get_harmony_encoding() -> HarmonyEncoding:
+    """
+    Load the GPT-OSS harmony encoding once and share it across parser instances.
+
+    Returns
+    -------
+    HarmonyEncoding
+        The process-wide harmony encoding.
+    """
+    return load_harmony_encoding(HarmonyEncodingName.HARMONY_GPT_OSS)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import copy
 from typing import Any
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
 from mlx_lm.models.cache import (
     can_trim_prompt_cache,
@@ -69,7 +69,8 @@ class LRUPromptCache:
         """
         self.max_size = max_size
         self._cache: dict[int, Any] = {}
-        self._lru: deque[tuple[int, ...]] = deque()
+        # Ordered oldest -> newest; values are unused, so recency updates are O(1)
+        self._lru: OrderedDict[tuple[int, ...], None] = OrderedDict()
 
     def _search(self, tokens_ids: list[int]) -> SearchResult:
         """Search the cache for a prompt cache.
@@ -91,9 +92,12 @@ class LRUPromptCache:
         last_cache_index = -1
         index = 0
 
-        # Traverse the trie as far as possible
-        while index < len(tokens_ids) and tokens_ids[index] in current:
-            current = current[tokens_ids[index]]
+        # Traverse the trie as far as possible; one dict lookup per token
+        for tok in tokens_ids:
+            child = current.get(tok)
+            if child is None:
+                break
+            current = child
             if "cache" in current:
                 last_cache_index = index
             index += 1
@@ -116,18 +120,27 @@ class LRUPromptCache:
         longer = None
         common_prefix = index
         if index > 0 and last_cache_index <= 0:
+            # Paths are kept as (token, parent) links with their length, so each step
+            # is O(1) instead of copying the whole path; the winner is unrolled once
             best = None
-            stack = [(current, [])]
+            best_len = 0
+            stack = [(current, None, 0)]
             while stack:
-                current, extra = stack.pop()
+                current, extra, extra_len = stack.pop()
                 if "cache" in current:
-                    if best is None or len(extra) < len(best):
+                    if best is None or extra_len < best_len:
                         best = extra
+                        best_len = extra_len
                 else:
                     for tok in current:
-                        stack.append((current[tok], extra + [tok]))
+                        stack.append((current[tok], (tok, extra), extra_len + 1))
 
-            longer = tokens_ids[:index] + best
+            best_tokens = []
+            while best is not None:
+                tok, best = best
+                best_tokens.append(tok)
+            best_tokens.reverse()
+            longer = tokens_ids[:index] + best_tokens
 
         return self.SearchResult(None, shorter, longer, common_prefix)
 
@@ -252,8 +265,7 @@ class LRUPromptCache:
         # If this is the last reference, remove from cache and LRU
         if cache_entry.count == 1:
             self._delete(tokens_ids)
-            # FIXED: Convert list to tuple for deque.remove()
-            self._lru.remove(tuple(tokens_ids))
+            del self._lru[tuple(tokens_ids)]
             return cache_entry
 
         # Otherwise, decrement count and return a copy
@@ -292,17 +304,16 @@ class LRUPromptCache:
         # Update existing or create new entry
         if "cache" in current:
             current["cache"].count += 1
-            # FIXED: Use tuple for deque.remove()
-            self._lru.remove(tokens_tuple)
         else:
             current["cache"] = self.CacheEntry(prompt_cache, 1)
 
         # Move to end of LRU (most recently used)
-        self._lru.append(tokens_tuple)
+        self._lru[tokens_tuple] = None
+        self._lru.move_to_end(tokens_tuple)
         
         # Evict oldest if over capacity
         if len(self._lru) > self.max_size:
-            oldest_tokens = self._lru.popleft()
+            oldest_tokens, _ = self._lru.popitem(last=False)
             # Convert back to list for _delete
             self._delete(list(oldest_tokens))
 
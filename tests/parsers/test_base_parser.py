@@ -0,0 +1,101 @@
+"""Tests for the legacy base thinking and tool parsers."""
+
+import unittest
+from app.handler.parser.base import BaseThinkingParser, BaseToolParser
+
+class TestBaseThinkingParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parser = BaseThinkingParser(thinking_open="<think>", thinking_close="</think>")
+
+    def test_parse(self) -> None:
+        self.assertEqual(self.parser.parse("<think> plan </think> answer"), ("plan", "answer"))
+        self.assertEqual(self.parser.parse("pre <think>a</think> post"), ("a", "post"))
+
+    def test_parse_without_complete_block(self) -> None:
+        self.assertEqual(self.parser.parse("no tags"), (None, "no tags"))
+        self.assertEqual(self.parser.parse("<think>unclosed"), (None, "<think>unclosed"))
+
+    def test_parse_stream(self) -> None:
+        chunks = ["Hi <think>step", " one", "</think>Done"]
+        outputs = [self.parser.parse_stream(chunk) for chunk in chunks]
+        self.assertEqual(outputs, [
+            ({"reasoning_content": "step"}, False),
+            ({"reasoning_content": " one"}, False),
+            ("Done", True),
+        ])
+        self.assertFalse(self.parser.is_thinking)
+
+    def test_parse_stream_bare_tags(self) -> None:
+        chunks = ["<think>", "r", "</think>"]
+        outputs = [self.parser.parse_stream(chunk) for chunk in chunks]
+        self.assertEqual(outputs, [
+            (None, False),
+            ({"reasoning_content": "r"}, False),
+            (None, True),
+        ])
+
+    def test_parse_stream_both_tags_in_one_chunk(self) -> None:
+        self.assertEqual(self.parser.parse_stream("a<think>x</think>b"), ("ab", True))
+        self.assertFalse(self.parser.is_thinking)
+
+    def test_parse_stream_plain_text(self) -> None:
+        self.assertEqual(self.parser.parse_stream("plain"), ("plain", False))
+        self.assertEqual(self.parser.parse_stream(None), (None, False))
+
+
+class TestBaseToolParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parser = BaseToolParser(tool_open="<tool_call>", tool_close="</tool_call>")
+
+    def test_parse_multiple_tools(self) -> None:
+        content = (
+            "Before <tool_call>{\"name\": \"a\", \"arguments\": {\"x\": 1}}</tool_call> middle "
+            "<tool_call>{\"name\": \"b\", \"arguments\": {}}</tool_call> after"
+        )
+        tool_calls, remaining = self.parser.parse(content)
+        self.assertEqual(tool_calls, [
+            {"name": "a", "arguments": {"x": 1}},
+            {"name": "b", "arguments": {}},
+        ])
+        self.assertEqual(remaining, "Before middle after")
+
+    def test_parse_repairs_malformed_json(self) -> None:
+        content = "<tool_call>{\"name\": \"a\", \"arguments\": {\"x\": 1}</tool_call>"
+        tool_calls, remaining = self.parser.parse(content)
+        self.assertEqual(tool_calls, [{"name": "a", "arguments": {"x": 1}}])
+        self.assertEqual(remaining, "")
+
+    def test_parse_without_tools(self) -> None:
+        self.assertEqual(self.parser.parse("no tools"), ([], "no tools"))
+
+    def test_parse_stream(self) -> None:
+        chunks = [
+            "Hello <tool_call>",
+            "{\"name\": \"f\", ",
+            "\"arguments\": {\"x\": 1}}",
+            "</tool_call> bye",
+        ]
+        outputs = [self.parser.parse_stream(chunk) for chunk in chunks]
+        empty = {"name": None, "arguments": None, "content": None}
+        self.assertEqual(outputs, [
+            ({"name": None, "arguments": None, "content": "Hello "}, False),
+            (empty, False),
+            (empty, False),
+            ({"name": "f", "arguments": "{'x': 1}", "content": " bye"}, True),
+        ])
+
+    def test_parse_stream_close_tag_in_own_chunk(self) -> None:
+        chunks = ["<tool_call>{\"name\": \"g\", \"arguments\": {}}", "</tool_call>"]
+        outputs = [self.parser.parse_stream(chunk) for chunk in chunks]
+        self.assertEqual(outputs[-1], ({"name": "g", "arguments": "{}", "content": None}, True))
+
+    def test_parse_stream_plain_text(self) -> None:
+        self.assertEqual(
+            self.parser.parse_stream("plain"),
+            ({"name": None, "arguments": None, "content": "plain"}, True),
+        )
+        self.assertEqual(self.parser.parse_stream(None), (None, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
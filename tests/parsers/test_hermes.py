@@ -69,5 +69,20 @@ def test_hermes_reasoning_and_tool_parsing_streaming() -> None:
     assert complete_tool_call["tool_calls"][0]["arguments"] == '{"argument_name": "argument_value"}'
 
 
+def test_hermes_reasoning_streaming_single_chunk_block() -> None:
+    """Test streaming parsing when a whole reasoning block arrives in one chunk."""
+    reasoning_parser = HermesReasoningParser()
+
+    reasoning, is_complete = reasoning_parser.extract_reasoning_streaming(
+        "<think>short thought</think>The answer"
+    )
+
+    assert is_complete
+    assert reasoning == {
+        "reasoning_content": "short thought",
+        "after_reasoning_close_content": "The answer",
+    }
+
+
 if __name__ == "__main__":
     test_hermes_reasoning_and_tool_parsing_streaming()
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""Tests for the legacy Harmony parser."""
+
+from app.handler.parser.harmony import HarmonyParser
+
+REASONING_TEXT = "We need to call get_weather function with city Tokyo."
+TOOL_CALL_TEXT = (
+    f"<|channel|>analysis<|message|>{REASONING_TEXT}<|end|>"
+    "<|start|>assistant<|channel|>commentary to=functions.get_weather "
+    "<|constrain|>json<|message|>{\"city\":\"Tokyo\"}"
+)
+
+
+def test_legacy_harmony_parse_stream_accumulates_channels() -> None:
+    """Test that streamed deltas are returned per chunk and accumulated per channel."""
+    parser = HarmonyParser()
+
+    chunks = [
+        "<|channel|>",
+        "analysis",
+        "<|message|>",
+        "We need to call",
+        " get_weather function with city Tokyo.",
+        "<|end|>",
+        "<|start|>",
+        "assistant",
+        "<|channel|>",
+        "commentary",
+        " to=functions.get_weather ",
+        "<|constrain|>",
+        "json",
+        "<|message|>",
+        "{\"city\":",
+        "\"Tokyo\"}",
+    ]
+
+    reasoning_deltas = []
+    tool_deltas = []
+    for chunk in chunks:
+        parsed_content, is_complete = parser.parse_stream(chunk)
+        assert is_complete is False
+        if isinstance(parsed_content, dict):
+            if "reasoning_content" in parsed_content:
+                reasoning_deltas.append(parsed_content["reasoning_content"])
+            else:
+                tool_deltas.append(parsed_content)
+
+    assert "".join(reasoning_deltas) == REASONING_TEXT
+    assert parser.get_accumulated_content("analysis") == {"analysis": REASONING_TEXT}
+
+    assert tool_deltas[0]["name"] == "get_weather"
+    arguments = "".join(delta.get("arguments", "") for delta in tool_deltas)
+    assert arguments == "{\"city\":\"Tokyo\"}"
+    assert parser.get_current_function_info() == {"name": "get_weather", "arguments": arguments}
+    assert parser.is_tool_parsing_active()
+
+    # The end tool chunk completes the stream
+    assert parser.parse_stream("<|call|>") == (None, True)
+    assert parser.is_stream_ended()
+
+
+def test_legacy_harmony_parse_strips_end_tool_chunk() -> None:
+    """Test non-streaming parsing with and without the trailing end tool chunk."""
+    parser = HarmonyParser()
+
+    expected = {
+        "reasoning_content": REASONING_TEXT,
+        "tool_calls": [{"name": "get_weather", "arguments": "{\"city\":\"Tokyo\"}"}],
+        "content": None,
+    }
+    assert parser.parse(TOOL_CALL_TEXT + "<|call|>") == expected
+    assert parser.parse(TOOL_CALL_TEXT) == expected
+
+
+def test_legacy_harmony_parser_has_no_instance_dict() -> None:
+    """Test that the parser state lives in __slots__."""
+    parser = HarmonyParser()
+
+    assert not hasattr(parser, "__dict__")
+    parser.reset()
+    assert parser.get_accumulated_content() == {}
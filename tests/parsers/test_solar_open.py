@@ -0,0 +1,55 @@
+"""Tests for the Solar Open parser."""
+
+from app.parsers.solar_open import SolarOpenToolParser
+
+
+def test_solar_open_tool_parsing() -> None:
+    """Test parsing of complete model output with tool calls."""
+    tool_parser = SolarOpenToolParser()
+    model_output = (
+        "<|tool_call:begin|>call_1<|tool_call:name|>get_weather"
+        "<|tool_call:args|>{\"city\": \"Seoul\"}<|tool_call:end|>"
+    )
+
+    result = tool_parser.extract_tool_calls(model_output)
+
+    assert result == {
+        "tool_calls": [{"name": "get_weather", "arguments": "{\"city\": \"Seoul\"}"}],
+        "content": None,
+    }
+
+
+def test_solar_open_tool_parsing_streaming_split_tags() -> None:
+    """Test streaming parsing when tags are split across chunk boundaries."""
+    tool_parser = SolarOpenToolParser()
+    chunks = [
+        "<|tool_",
+        "call:begin|>call_1<|tool_call:name|>get_weather<|tool_call:args|>",
+        "{\"city\": ",
+        "\"Seoul\"}<|tool_call:",
+        "end|>",
+    ]
+
+    results = [tool_parser.extract_tool_calls_streaming(chunk) for chunk in chunks]
+
+    # Nothing is emitted until the closing tag completes in the last chunk
+    assert all(result == (None, False) for result in results[:-1])
+    parsed_content, is_complete = results[-1]
+    assert is_complete
+    assert parsed_content["tool_calls"] == [
+        {"name": "get_weather", "arguments": "{\"city\": \"Seoul\"}"}
+    ]
+
+
+def test_solar_open_content_streaming_split_token() -> None:
+    """Test streaming parsing of a content response whose token is split across chunks."""
+    tool_parser = SolarOpenToolParser()
+    chunks = ["<|cont", "ent|>Hello", ", world"]
+
+    results = [tool_parser.extract_tool_calls_streaming(chunk) for chunk in chunks]
+
+    assert results == [
+        (None, False),
+        ({"content": "Hello"}, True),
+        ({"content": ", world"}, True),
+    ]
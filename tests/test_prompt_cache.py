@@ -0,0 +1,109 @@
+"""Tests for the LRU prompt cache."""
+
+from __future__ import annotations
+
+from mlx_lm.models.cache import KVCache
+
+from app.utils.prompt_cache import LRUPromptCache
+
+
+def _build_cache() -> LRUPromptCache:
+    """Build a small trie with branching entries."""
+    cache = LRUPromptCache(max_size=10)
+    cache.insert_cache([1, 2, 3], ["exact"])
+    cache.insert_cache([7, 8, 9, 10], [KVCache()])
+    cache.insert_cache([7, 8, 6], [KVCache()])
+    return cache
+
+
+def test_search_exact_match() -> None:
+    """Test that a cached sequence is found as an exact match."""
+    cache = _build_cache()
+
+    result = cache._search([1, 2, 3])
+
+    assert result.exact == [1, 2, 3]
+    assert result.shorter is None
+    assert result.longer is None
+
+
+def test_search_shorter_match() -> None:
+    """Test that the longest cached prefix of a query is found."""
+    cache = _build_cache()
+
+    result = cache._search([1, 2, 3, 4, 5])
+
+    assert result.exact is None
+    assert result.shorter == [1, 2, 3]
+    assert result.longer is None
+
+
+def test_search_longer_match_prefers_shortest_extension() -> None:
+    """Test that the longer-cache search returns the closest cached extension."""
+    cache = _build_cache()
+
+    result = cache._search([7, 8])
+
+    assert result.exact is None
+    assert result.shorter is None
+    assert result.longer == [7, 8, 6]
+    assert result.common_prefix == 2
+
+
+def test_fetch_nearest_cache() -> None:
+    """Test the prompt cache and remaining tokens returned for each kind of hit."""
+    cache = _build_cache()
+
+    prompt_cache, remaining = cache.fetch_nearest_cache([1, 2, 3])
+    assert prompt_cache == ["exact"]
+    assert remaining == []
+
+    # The last reference was handed out, so the entry is gone
+    cache.insert_cache([1, 2, 3], ["shorter"])
+    prompt_cache, remaining = cache.fetch_nearest_cache([1, 2, 3, 4])
+    assert prompt_cache == ["shorter"]
+    assert remaining == [4]
+    assert cache.fetch_nearest_cache([1, 2, 3]) == (None, [1, 2, 3])
+
+    # A longer hit hands out a trimmed copy and keeps the cached entry
+    prompt_cache, remaining = cache.fetch_nearest_cache([7, 8])
+    assert prompt_cache is not cache._get([7, 8, 6]).prompt_cache
+    assert remaining == [8]
+
+    prompt_cache, remaining = cache.fetch_nearest_cache([5, 6])
+    assert prompt_cache is None
+    assert remaining == [5, 6]
+
+
+def test_insert_evicts_least_recently_used() -> None:
+    """Test that inserting past max_size evicts entries oldest first."""
+    cache = LRUPromptCache(max_size=2)
+    cache.insert_cache([1], ["a"])
+    cache.insert_cache([2], ["b"])
+    cache.insert_cache([3], ["c"])
+
+    assert list(cache._lru) == [(2,), (3,)]
+    assert 1 not in cache._cache
+    assert cache.fetch_nearest_cache([1]) == (None, [1])
+
+    cache.insert_cache([4], ["d"])
+
+    assert list(cache._lru) == [(3,), (4,)]
+    assert 2 not in cache._cache
+
+
+def test_insert_hit_refreshes_recency() -> None:
+    """Test that re-inserting a cached sequence makes it the most recently used."""
+    cache = LRUPromptCache(max_size=2)
+    cache.insert_cache([1], ["a"])
+    cache.insert_cache([2], ["b"])
+
+    cache.insert_cache([1], ["a"])
+    assert list(cache._lru) == [(2,), (1,)]
+    assert cache._get([1]).count == 2
+
+    cache.insert_cache([3], ["c"])
+
+    assert list(cache._lru) == [(1,), (3,)]
+    assert 2 not in cache._cache
+    assert cache.fetch_nearest_cache([1]) == (["a"], [])